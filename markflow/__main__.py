@@ -74,6 +74,7 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         "--output-dir",
         "--output-directory",
         "--output-file",
+        "--strict",
         "--write-renders",
     ]
     show_developer_help = any(o in argv for o in developer_options)
@@ -171,6 +172,16 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         if show_developer_help
         else argparse.SUPPRESS,
     )
+    dev_arguments.add_argument(
+        "--strict",
+        action="store_true",
+        help=(
+            "Reformat the reformatted text of each file and fail if it changes. This "
+            "doubles the work done, but catches inconsistencies in MarkFlow."
+        )
+        if show_developer_help
+        else argparse.SUPPRESS,
+    )
     dev_arguments.add_argument(
         "--write-renders",
         action="store_true",
@@ -179,7 +190,8 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
             "inconsistent. The file with the first formatting is named with a .1 (i.e. "
             "file.md -> file.1.md, file -> file.1) and the second with a .2. Note: "
             "This will result in the file being parsed four times: twice for first "
-            "pass to detect the error, then twice more to generate the files."
+            "pass to detect the error, then twice more to generate the files. Implies "
+            "--strict."
         )
         if show_developer_help
         else argparse.SUPPRESS,
@@ -279,7 +291,9 @@ def _reformat_files(args: argparse.Namespace) -> int:
     for input_path, output_path in zip(args.paths, output_paths):
         old_contents = input_path.read_text()
         try:
-            new_contents = reformat_markdown_text(old_contents, args.line_length)
+            new_contents = reformat_markdown_text(
+                old_contents, args.line_length, args.strict or args.write_renders
+            )
         except RuntimeError as runtime_error:
             if args.write_renders and isinstance(
                 runtime_error, ReformatInconsistentException
@@ -341,7 +355,9 @@ def _reformat_stdin(args: argparse.Namespace, stdin: TextIO) -> int:
 
     old_contents = stdin.read()
     try:
-        new_contents = reformat_markdown_text(old_contents, args.line_length)
+        new_contents = reformat_markdown_text(
+            old_contents, args.line_length, args.strict or args.write_renders
+        )
     except RuntimeError as runtime_error:
         if args.write_renders and isinstance(
             runtime_error, ReformatInconsistentException
@@ -5,23 +5,96 @@ This library is used a common space to evaluate position independent information
 lines. They are stored here so as to avoid any circular imports.
 """
 
-import re
-
-from .._utils import get_indent
-
-FENCED_CODE_BLOCK_FENCE_CHARACTERS = ["`", "~"]
-LIST_START_REGEX = re.compile(
-    r"^\s*"  # Leading spaces are OK and often expected
-    r"("
-    r"\*|"  # Asterisk list marker
-    r"-|"  # Dash list marker
-    r"\+|"  # Plust list marker
-    r"[0-9]+\."  # Numeric list marker
-    r") "  # Lists need a space after their identifier
-)
-THEMATIC_BREAK_CHARACTERS = ["*", "_", "-"]
+import functools
+from typing import Callable, Dict, NamedTuple, Tuple
+
+from ..typing import MarkdownSectionEnum
+
+# Documents are classified line by line by several detectors and then reclassified
+# during the consistency pass, so we memoize our results.
+LINE_CACHE_SIZE = 4096
+
+FENCED_CODE_BLOCK_FENCE_CHARACTERS = frozenset("`~")
+# Fences are at least three fence characters, so any fence starts with one of these
+_FENCE_PREFIXES = ("```", "~~~")
+# List markers are either a bullet or a number followed by a period
+LIST_BULLET_CHARACTERS = frozenset("*-+")
+LIST_NUMBER_CHARACTERS = frozenset("0123456789")
+THEMATIC_BREAK_CHARACTERS = frozenset("*_-")
+
+
+class LineInfo(NamedTuple):
+    """Position independent information about a line shared by our detectors"""
+
+    lstripped: str
+    stripped: str
+    indent: int
+    first_char: str
+
+
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
+def get_line_info(line: str) -> LineInfo:
+    """Gathers the information our detectors need about a line
+
+    Args:
+        line: The line to evaluate
+
+    Returns:
+        The line's information. The first character is an empty string for blank lines.
+    """
+    lstripped = line.lstrip()
+    return LineInfo(
+        lstripped=lstripped,
+        stripped=lstripped.rstrip(),
+        indent=len(line) - len(lstripped),
+        first_char=lstripped[:1],
+    )
+
+
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
+def classify_line(line: str) -> MarkdownSectionEnum:
+    """Determines what type of section a line would start
+
+    Rather than asking every detector about the line, we look at the line's indentation
+    and first non-whitespace character, which is enough to rule out all but one or two
+    section types. Only those remaining candidates, found in _FIRST_CHAR_CANDIDATES, are
+    evaluated in full.
+
+    Since this only looks at a single line, the result is the section type the line
+    starts on its own. Lines that start a paragraph may still end up being part of a
+    setext heading, and lines returned as link reference definitions may turn out to
+    be paragraphs once the following lines are evaluated.
+
+    Args:
+        line: The line to evaluate
+
+    Returns:
+        The type of section the line would start.
+    """
+    line_info = get_line_info(line)
+    if not line_info.stripped:
+        return MarkdownSectionEnum.BLANK_LINE
 
+    first_char = line_info.first_char
+    if line_info.indent >= 4:
+        # Fenced code blocks are the only section allowed to be over-indented
+        if first_char in FENCED_CODE_BLOCK_FENCE_CHARACTERS:
+            if is_fenced_code_block_start_line(line):
+                return MarkdownSectionEnum.FENCED_CODE_BLOCK
+        return MarkdownSectionEnum.INDENTED_CODE_BLOCK
 
+    if first_char == "[":
+        # Whether this is a link reference definition depends on the following lines
+        return MarkdownSectionEnum.LINK_REFERENCE_DEFINITION
+
+    for detector, section_type in _FIRST_CHAR_CANDIDATES.get(first_char, ()):
+        if detector(line):
+            return section_type
+
+    return MarkdownSectionEnum.PARAGRAPH
+
+
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_atx_heading_line(line: str) -> bool:
     """Evaluates whether a line is formatted like an ATX heading
 
@@ -40,9 +113,13 @@ def is_atx_heading_line(line: str) -> bool:
     Returns:
         True if the line is an ATX heading. False otherwise.
     """
-    return not is_indented_code_block_start_line(line) and line.lstrip().startswith("#")
+    return (
+        not is_indented_code_block_start_line(line)
+        and get_line_info(line).first_char == "#"
+    )
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_blank_line_line(line: str) -> bool:
     """Evaluates whether a line is a blank line
 
@@ -57,9 +134,10 @@ def is_blank_line_line(line: str) -> bool:
     Returns:
         True if the line is an ATX heading. False otherwise.
     """
-    return not line.strip()
+    return not get_line_info(line).stripped
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_block_quote_line(line: str) -> bool:
     """Evaluates whether a line is a block quote line
 
@@ -74,9 +152,13 @@ def is_block_quote_line(line: str) -> bool:
     Returns:
         True if the line is an block quote line. False otherwise.
     """
-    return not is_indented_code_block_start_line(line) and line.lstrip().startswith(">")
+    return (
+        not is_indented_code_block_start_line(line)
+        and get_line_info(line).first_char == ">"
+    )
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_fenced_code_block_start_line(line: str) -> bool:
     """Evaluates whether a line could open a fenced code block
 
@@ -92,12 +174,10 @@ def is_fenced_code_block_start_line(line: str) -> bool:
     Returns:
         True if the line is could open a fenced code block. False otherwise.
     """
-    for fence in FENCED_CODE_BLOCK_FENCE_CHARACTERS:
-        if line.strip().startswith(fence * 3):
-            return True
-    return False
+    return get_line_info(line).stripped.startswith(_FENCE_PREFIXES)
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_indented_code_block_start_line(line: str) -> bool:
     """Evaluates whether a line could start and indented code block
 
@@ -112,9 +192,12 @@ def is_indented_code_block_start_line(line: str) -> bool:
     Returns:
         True if the line is could start an indented code block. False otherwise.
     """
-    return bool(line.strip()) and get_indent(line) >= 4
+    # Only the first four characters matter, so there's no need to measure the full
+    # indentation of deeply indented lines
+    return line[:4].isspace() and not line.isspace()
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_list_start_line(line: str) -> bool:
     """Evaluates whether a line could start a list
 
@@ -130,11 +213,31 @@ def is_list_start_line(line: str) -> bool:
     Returns:
         True if the line is could start a list. False otherwise.
     """
-    return not is_indented_code_block_start_line(line) and bool(
-        LIST_START_REGEX.search(line)
-    )
+    line_info = get_line_info(line)
+    lstripped = line_info.lstripped
+    if line_info.first_char in LIST_BULLET_CHARACTERS:
+        marker_length = 1
+    elif line_info.first_char in LIST_NUMBER_CHARACTERS:
+        # Skip over the rest of the number which must then be followed by a period
+        marker_length = 1
+        while (
+            marker_length < len(lstripped)
+            and lstripped[marker_length] in LIST_NUMBER_CHARACTERS
+        ):
+            marker_length += 1
+        if lstripped[marker_length : marker_length + 1] != ".":
+            return False
+        marker_length += 1
+    else:
+        return False
+
+    # Lists need a space after their marker
+    if lstripped[marker_length : marker_length + 1] != " ":
+        return False
+    return not is_indented_code_block_start_line(line)
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_paragraph_start_line(line: str) -> bool:
     """Evaluates whether a line could start a paragraph
 
@@ -151,21 +254,14 @@ def is_paragraph_start_line(line: str) -> bool:
     Returns:
         True if the line is could start a list. False otherwise.
     """
-    for line_checker in [
-        is_indented_code_block_start_line,
-        is_atx_heading_line,
-        is_blank_line_line,
-        is_block_quote_line,
-        is_fenced_code_block_start_line,
-        is_list_start_line,
-        is_table_start_line,
-        is_thematic_break_line,
-    ]:
-        if line_checker(line):
-            return False
-    return True
+    # Link reference definitions fall back to paragraphs if they are not complete
+    return classify_line(line) in (
+        MarkdownSectionEnum.LINK_REFERENCE_DEFINITION,
+        MarkdownSectionEnum.PARAGRAPH,
+    )
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_setext_underline(line: str) -> bool:
     """Evaluates whether a line could be the underlining for a setext heading
 
@@ -181,16 +277,16 @@ def is_setext_underline(line: str) -> bool:
     Returns:
         True if the line is could underline an setext heading. False otherwise.
     """
+    stripped = get_line_info(line).stripped
     return (
         not is_indented_code_block_start_line(line)
-        and bool(line.strip())
-        and (
-            all([c == "=" for c in line.strip()])
-            or all([c == "-" for c in line.strip()])
-        )
+        and bool(stripped)
+        # Stripping the underline character leaves nothing if it's all that's there
+        and (not stripped.strip("=") or not stripped.strip("-"))
     )
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_table_start_line(line: str) -> bool:
     """Evaluates whether a line could start a table
 
@@ -207,20 +303,55 @@ def is_table_start_line(line: str) -> bool:
     """
     # ToDo: Not really, but we'll have to adapt a standard from somewhere other than
     #  CommonMark
-    return line.lstrip().startswith("|")
+    return get_line_info(line).first_char == "|"
 
 
+@functools.lru_cache(maxsize=LINE_CACHE_SIZE)
 def is_thematic_break_line(line: str) -> bool:
     if is_indented_code_block_start_line(line):
         return False
 
-    spaceless_line = "".join(line.split())
-    if len(spaceless_line) < 3:
-        # Thematic breaks must be at least three characters long
-        return False
-    else:
-        for symbol in THEMATIC_BREAK_CHARACTERS:
-            if all(char == symbol for char in spaceless_line.strip()):
-                return True
+    # Each bit of the mask represents one of the thematic break characters. Seeing a
+    # character clears the bits of the others, so mixing characters clears the mask.
+    symbol_count = 0
+    mask = 0b111
+    for char in line:
+        if char.isspace():
+            continue
+        elif char == "*":
+            mask &= 0b001
+        elif char == "-":
+            mask &= 0b010
+        elif char == "_":
+            mask &= 0b100
         else:
             return False
+        if not mask:
+            return False
+        symbol_count += 1
+
+    # Thematic breaks must be at least three characters long
+    return symbol_count >= 3
+
+
+_LIST_CANDIDATES = (
+    # Lists take precedence so that lines like "* * *" are lists
+    (is_list_start_line, MarkdownSectionEnum.LIST),
+    (is_thematic_break_line, MarkdownSectionEnum.THEMATIC_BREAK),
+)
+# The detectors, in order of precedence, that could match a line starting with a given
+# non-whitespace character. Lines not matched by any of them start paragraphs.
+_FIRST_CHAR_CANDIDATES: Dict[
+    str, Tuple[Tuple[Callable[[str], bool], MarkdownSectionEnum], ...]
+] = {
+    "#": ((is_atx_heading_line, MarkdownSectionEnum.ATX_HEADING),),
+    ">": ((is_block_quote_line, MarkdownSectionEnum.BLOCK_QUOTE),),
+    "|": ((is_table_start_line, MarkdownSectionEnum.TABLE),),
+    "`": ((is_fenced_code_block_start_line, MarkdownSectionEnum.FENCED_CODE_BLOCK),),
+    "~": ((is_fenced_code_block_start_line, MarkdownSectionEnum.FENCED_CODE_BLOCK),),
+    "_": ((is_thematic_break_line, MarkdownSectionEnum.THEMATIC_BREAK),),
+    **{
+        char: _LIST_CANDIDATES
+        for char in LIST_BULLET_CHARACTERS | LIST_NUMBER_CHARACTERS
+    },
+}
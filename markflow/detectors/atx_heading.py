@@ -22,9 +22,7 @@ from typing import List, Tuple
 from ._lines import is_atx_heading_line
 
 
-def split_atx_heading(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+def split_atx_heading(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
     """Split leading ATX heading from lines if one exists
 
     While the standard does require that ATX headings have a space between the
@@ -33,15 +31,15 @@ def split_atx_heading(
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the ATX heading lines if they were found,
-        otherwise it is an empty list. The second value is the remaining text. (If lines
-        does not start with an ATX heading, it is the same as lines.)
+        otherwise it is an empty list. The second value is the index of the line
+        following them. (If lines does not have an ATX heading at start, it is start.)
     """
-    if is_atx_heading_line(lines[0]):
-        return [lines[0]], lines[1:]
+    if is_atx_heading_line(lines[start]):
+        return [lines[start]], start + 1
     else:
-        return [], lines
+        return [], start
@@ -15,23 +15,21 @@ from typing import List, Tuple
 from ._lines import is_blank_line_line
 
 
-def split_blank_line(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+def split_blank_line(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
     """Split leading blank line from lines if one exists
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the blank line if it was found (as a
         single-element list), otherwise it is an empty list. The second value is the
-        remaining text. (If lines does not start with a blank line, it is the same as
-        lines.)
+        index of the line following it. (If lines does not have a blank line at start,
+        it is start.)
     """
-    if is_blank_line_line(lines[0]):
-        return [lines[0]], lines[1:]
+    if is_blank_line_line(lines[start]):
+        return [lines[start]], start + 1
     else:
-        return [], lines
+        return [], start
@@ -13,21 +13,11 @@ def block_quote_ended(line: str, index: int, lines: List[str]) -> bool:
     return is_blank_line_line(line) or is_list_start_line(line)
 
 
-def split_block_quote(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
-    block_quote = []
-    remaining_lines = lines
-
-    index = 0
+def split_block_quote(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
+    index = start
     if block_quote_started(lines[index], index, lines):
-        block_quote.append(lines[index])
-        for index, line in enumerate(lines[1:], start=index + 1):
-            if block_quote_ended(line, index, lines):
-                break
-            block_quote.append(line)
-        else:
+        index += 1
+        while index < len(lines) and not block_quote_ended(lines[index], index, lines):
             index += 1
-    remaining_lines = lines[index:]
 
-    return block_quote, remaining_lines
+    return lines[start:index], index
@@ -94,25 +94,23 @@ def fenced_code_block_ended(line: str, index: int, lines: List[str]) -> bool:
     return False
 
 
-def split_fenced_code_block(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+def split_fenced_code_block(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
     """Split leading fenced code block from lines if one exists
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the fenced code block lines if they were
-        found, otherwise it is an empty list. The second value is the remaining text.
-        (If lines does not start with a fenced code block, it is the same as lines.)
+        found, otherwise it is an empty list. The second value is the index of the line
+        following them. (If lines does not have a fenced code block at start, it is
+        start.)
     """
     # TODO: Fenced code blocks can't be indented
     fenced_code_block: List[str] = []
-    remaining_lines = lines
-    indexed_line_generator = enumerate(lines)
+    indexed_line_generator = ((i, lines[i]) for i in range(start, len(lines)))
 
     index, line = next(indexed_line_generator)
     for fence in FENCES:
@@ -122,7 +120,7 @@ def split_fenced_code_block(
             full_fence = fence * count
             break
     else:
-        return fenced_code_block, remaining_lines
+        return fenced_code_block, start
 
     fenced_code_block.append(line)
 
@@ -133,9 +131,8 @@ def split_fenced_code_block(
                 logger.warning(
                     "Detected that the fence on line %d is over indented per the "
                     "standard. If this is intentional, please file a bug report."
-                    % (index + line_offset + 1)
+                    % (index + 1)
                 )
             break
 
-    remaining_lines = remaining_lines[index + 1 :]
-    return fenced_code_block, remaining_lines
+    return fenced_code_block, index + 1
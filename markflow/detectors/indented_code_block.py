@@ -16,23 +16,24 @@ from .._utils import get_indent
 
 
 def split_indented_code_block(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+    lines: List[str], start: int = 0
+) -> Tuple[List[str], int]:
     """Split leading indented code block from lines if one exists
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the indented code block lines if they were
-        found, otherwise it is an empty list. The second value is the remaining text.
-        (If lines does not start with an indented code block, it is the same as lines.)
+        found, otherwise it is an empty list. The second value is the index of the line
+        following them. (If lines does not have an indented code block at start, it is
+        start.)
     """
-    indented_code_block = []
-    remaining_lines = lines
-    indexed_line_generator = enumerate(lines)
+    indented_code_block: List[str] = []
+    end = start
+    indexed_line_generator = ((i, lines[i]) for i in range(start, len(lines)))
 
     # By default, everything to the end of the document is a block quote
     index, line = next(indexed_line_generator)
@@ -48,7 +49,7 @@ def split_indented_code_block(
             else:
                 break
 
-        indented_code_block = lines[:close_index]
-        remaining_lines = lines[close_index:]
+        indented_code_block = lines[start:close_index]
+        end = close_index
 
-    return indented_code_block, remaining_lines
+    return indented_code_block, end
@@ -40,34 +40,33 @@ QUOTATION_CHARACTERS = "'\""
 
 
 def split_link_reference_definition(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+    lines: List[str], start: int = 0
+) -> Tuple[List[str], int]:
     """Split leading link reference definition from lines if one exists
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the indented code block lines if they were
-        found, otherwise it is an empty list. The second value is the remaining text.
-        (If lines does not start with a link reference definition, it is the same as
-        lines.)
+        found, otherwise it is an empty list. The second value is the index of the line
+        following them. (If lines does not have a link reference definition at start, it
+        is start.)
     """
     link_reference_definition: List[str] = []
-    remaining_lines = lines
-    indexed_line_generator = enumerate(lines)
+    indexed_line_generator = ((i, lines[i]) for i in range(start, len(lines)))
 
     index, line = next(indexed_line_generator)
 
     if get_indent(line) >= 4:
-        return link_reference_definition, remaining_lines
+        return link_reference_definition, start
 
     rest_of_line = line.lstrip()
     match = LINK_REFERENCE_DEFINITION_FIRST_ELEMENT_REGEX.match(rest_of_line)
     if not match:
-        return link_reference_definition, remaining_lines
+        return link_reference_definition, start
 
     rest_of_line = rest_of_line[match.end() :]
     url_and_title = rest_of_line.split(maxsplit=1)
@@ -105,9 +104,8 @@ def split_link_reference_definition(
                 "does not contain a link. We will be treating it as if it were.",
                 index,  # We are just pass where the issue exists
             )
-            link_reference_definition = [lines[0]]
-            remaining_lines = lines[1:]
-            return link_reference_definition, remaining_lines
+            link_reference_definition = [lines[start]]
+            return link_reference_definition, start + 1
         elif len(line.split(maxsplit=1)) == 1:
             # Only the URL is on the second line
             index, line = next(indexed_line_generator)
@@ -135,7 +133,7 @@ def split_link_reference_definition(
                 break
 
     if is_complete:
-        link_reference_definition = lines[:index]
-        remaining_lines = lines[index:]
+        link_reference_definition = lines[start:index]
+        return link_reference_definition, index
 
-    return link_reference_definition, remaining_lines
+    return link_reference_definition, start
@@ -22,19 +22,11 @@ def list_ended(line: str, index: int, lines: List[str]) -> bool:
     )
 
 
-def split_list(lines: List[str], line_offset: int = 0) -> Tuple[List[str], List[str]]:
-    list_ = []
-    remaining_lines = lines
-
-    index = 0
+def split_list(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
+    index = start
     if list_started(lines[index], index, lines):
-        list_.append(lines[index])
-        for index, line in enumerate(lines[1:], start=index + 1):
-            if list_ended(line, index, lines):
-                break
-            list_.append(line)
-        else:
+        index += 1
+        while index < len(lines) and not list_ended(lines[index], index, lines):
             index += 1
-    remaining_lines = lines[index:]
 
-    return list_, remaining_lines
+    return lines[start:index], index
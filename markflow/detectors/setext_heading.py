@@ -23,22 +23,20 @@ from ._lines import is_setext_underline
 from .paragraph import split_paragraph_ignoring_setext
 
 
-def split_setext_heading(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+def split_setext_heading(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
     """Split setext heading from beginning of lines if one exists
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the setext heading lines if they were found,
-        otherwise it is an empty list. The second value is the remaining text. (If lines
-        does not start with a thematic break, it is the same as lines.)
+        otherwise it is an empty list. The second value is the index of the line
+        following them. (If lines does not have a setext heading at start, it is start.)
     """
-    paragraph, remaining_lines = split_paragraph_ignoring_setext(lines, line_offset)
-    if paragraph and remaining_lines and is_setext_underline(remaining_lines[0]):
-        return paragraph + [remaining_lines[0]], remaining_lines[1:]
-    return [], lines
+    paragraph, index = split_paragraph_ignoring_setext(lines, start)
+    if paragraph and index < len(lines) and is_setext_underline(lines[index]):
+        return paragraph + [lines[index]], index + 1
+    return [], start
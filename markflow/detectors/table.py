@@ -11,19 +11,11 @@ def table_ended(line: str, index: int, lines: List[str]) -> bool:
     return not table_started(line, index, lines)
 
 
-def split_table(lines: List[str], line_offset: int = 0) -> Tuple[List[str], List[str]]:
-    table = []
-    remaining_lines = lines
-
-    index = 0
+def split_table(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
+    index = start
     if table_started(lines[index], index, lines):
-        table.append(lines[index])
-        for index, line in enumerate(lines[1:], start=index + 1):
-            if table_ended(line, index, lines):
-                break
-            table.append(line)
-        else:
+        index += 1
+        while index < len(lines) and not table_ended(lines[index], index, lines):
             index += 1
-    remaining_lines = lines[index:]
 
-    return table, remaining_lines
+    return lines[start:index], index
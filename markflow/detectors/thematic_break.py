@@ -22,22 +22,20 @@ from ._lines import is_thematic_break_line
 SEPARATOR_SYMBOLS = ["*", "_", "-"]
 
 
-def split_thematic_break(
-    lines: List[str], line_offset: int = 0
-) -> Tuple[List[str], List[str]]:
+def split_thematic_break(lines: List[str], start: int = 0) -> Tuple[List[str], int]:
     """Split leading thematic break from lines if one exists
 
     Args:
         lines: The lines to evaluate.
-        line_offset (optional): The offset into the overall document we are at. This is
-            used for reporting errors in the original document.
+        start (optional): The index of the line in lines to start evaluating from. Since
+            lines is usually the whole document, this is also our position within it.
 
     Returns:
         A tuple of two values. The first is the indented code block lines if they were
-        found, otherwise it is an empty list. The second value is the remaining text.
-        (If lines does not start with a thematic break, it is the same as lines.)
+        found, otherwise it is an empty list. The second value is the index of the line
+        following them. (If lines does not have a thematic break at start, it is start.)
     """
-    if is_thematic_break_line(lines[0]):
-        return [lines[0]], lines[1:]
+    if is_thematic_break_line(lines[start]):
+        return [lines[start]], start + 1
     else:
-        return [], lines
+        return [], start
@@ -56,7 +56,8 @@ class MarkdownFencedCodeBlock(MarkdownSection):
 
     @property
     def first_line(self) -> Optional[str]:
-        if len(self.lines) == 2:
+        # Unclosed fences at the end of the document may have no other lines
+        if len(self.lines) <= 2:
             return None
         else:
             return self.lines[1].strip()
@@ -1,6 +1,5 @@
 import logging
-from enum import Enum
-from typing import Dict, List, Tuple, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 from .detectors import (
     split_atx_heading,
@@ -15,6 +14,7 @@ from .detectors import (
     split_table,
     split_thematic_break,
 )
+from .detectors._lines import classify_line
 from .exceptions import ReformatInconsistentException
 from .formatters import (
     MarkdownATXHeading,
@@ -30,28 +30,17 @@ from .formatters import (
     MarkdownTable,
     MarkdownThematicBreak,
 )
-from .typing import Number, SplitFunc
+from .typing import MarkdownSectionEnum, Number, SplitFunc
 
 __all__ = ["reformat_markdown_text"]
 
 logger = logging.getLogger(__name__)
 
+# Enum members are singletons, so we can look this up once and compare by identity
+_BLANK_LINE = MarkdownSectionEnum.BLANK_LINE
 
-class MarkdownSectionEnum(Enum):
-    ATX_HEADING = "ATX Heading"
-    BLANK_LINE = "Blank Line"
-    BLOCK_QUOTE = "Block Quote"
-    FENCED_CODE_BLOCK = "Fenced Code Block"
-    INDENTED_CODE_BLOCK = "Indented Code Block"
-    LINK_REFERENCE_DEFINITION = "Link Reference Definition"
-    LIST = "List"
-    PARAGRAPH = "Paragraph"
-    SETEXT_HEADING = "Setext Heading"
-    TABLE = "Table"
-    THEMATIC_BREAK = "Thematic Break"
 
-
-SPLITTERS: List[Tuple[MarkdownSectionEnum, SplitFunc]] = [
+SPLITTERS: Tuple[Tuple[MarkdownSectionEnum, SplitFunc], ...] = (
     (MarkdownSectionEnum.ATX_HEADING, split_atx_heading),
     (MarkdownSectionEnum.BLANK_LINE, split_blank_line),
     (MarkdownSectionEnum.BLOCK_QUOTE, split_block_quote),
@@ -64,7 +53,8 @@ SPLITTERS: List[Tuple[MarkdownSectionEnum, SplitFunc]] = [
     (MarkdownSectionEnum.PARAGRAPH, split_paragraph),
     (MarkdownSectionEnum.TABLE, split_table),
     (MarkdownSectionEnum.THEMATIC_BREAK, split_thematic_break),
-]
+)
+SPLITTERS_BY_SECTION_TYPE: Dict[MarkdownSectionEnum, SplitFunc] = dict(SPLITTERS)
 
 FORMATTERS: Dict[MarkdownSectionEnum, Type[MarkdownSection]] = {
     MarkdownSectionEnum.ATX_HEADING: MarkdownATXHeading,
@@ -81,34 +71,58 @@ FORMATTERS: Dict[MarkdownSectionEnum, Type[MarkdownSection]] = {
 }
 
 
-def _reformat_markdown_text(log_text: str, width: Number = 88) -> str:
+def _reformat_markdown_text(
+    log_text: str,
+    width: Number = 88,
+    *,
+    quiet: bool = False,
+    classify_cache: Optional[Dict[str, MarkdownSectionEnum]] = None,
+) -> str:
     # TODO: Sanitize newlines
-    remaining_lines = log_text.splitlines()
-    sections = []
-    current_line = 1
-    while remaining_lines:
-        for section_type, splitter in SPLITTERS:
-            section_content, remaining_lines = splitter(remaining_lines)
-            if section_content:
-                content_length = len(section_content)
-                if content_length > 1:
-                    log_text = (
-                        f"Lines {current_line}-{current_line + content_length - 1}"
-                    )
-                else:
-                    log_text = f"Line {current_line}"
-                logger.debug(
-                    "%s type: %s", log_text, section_type.value,
-                )
-                sections.append((section_type, section_content))
-                current_line += len(section_content)
-                break
+    lines = log_text.splitlines()
+    # Local names are faster to look up than globals in our hot loop
+    splitters = SPLITTERS
+    splitters_by_section_type = SPLITTERS_BY_SECTION_TYPE
+    sections: List[Tuple[MarkdownSectionEnum, List[str]]] = []
+    # Rather than slicing off each section, splitters are given the index to start from
+    # and return the index after their section, so we never copy the rest of the lines.
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if classify_cache is None:
+            section_type = classify_line(line)
         else:
-            raise RuntimeError(
-                "Could not determine section type on line {}".format(
-                    sum(len(content) for type, content in sections) + 1
-                ),
+            # classify_line's cache is bounded, so large documents can push their own
+            # lines out of it before they are seen again. This one lives as long as the
+            # document.
+            try:
+                section_type = classify_cache[line]
+            except KeyError:
+                section_type = classify_cache[line] = classify_line(line)
+        splitter = splitters_by_section_type[section_type]
+        section_content, next_index = splitter(lines, index)
+        if not section_content:
+            # The first line isn't always enough to know the section type (e.g. setext
+            # headings start like paragraphs), so fall back to trying every splitter.
+            for section_type, splitter in splitters:
+                section_content, next_index = splitter(lines, index)
+                if section_content:
+                    break
+            else:
+                raise RuntimeError(
+                    f"Could not determine section type on line {index + 1}"
+                )
+
+        if not quiet and logger.isEnabledFor(logging.DEBUG):
+            if next_index - index > 1:
+                log_text = f"Lines {index + 1}-{next_index}"
+            else:
+                log_text = f"Line {index + 1}"
+            logger.debug(
+                "%s type: %s", log_text, section_type.value,
             )
+        sections.append((section_type, section_content))
+        index = next_index
 
     formatters = []
     current_blank_lines = []
@@ -116,23 +130,31 @@ def _reformat_markdown_text(log_text: str, width: Number = 88) -> str:
     for section_type, section_content in sections:
         formatter = FORMATTERS[section_type](offset, section_content)
         content_length = len(section_content)
-        if content_length > 1:
-            log_text = f"Lines {offset + 1}-{offset + content_length}"
-        else:
-            log_text = f"Line {offset + 1}"
-        logger.info("%s: %s", log_text, repr(formatter))
-        if section_type == MarkdownSectionEnum.BLANK_LINE:
+        # Building the log text and the formatter's repr is expensive, so we avoid it
+        # when the message won't be logged.
+        if not quiet and logger.isEnabledFor(logging.INFO):
+            if content_length > 1:
+                log_text = f"Lines {offset + 1}-{offset + content_length}"
+            else:
+                log_text = f"Line {offset + 1}"
+            logger.info("%s: %r", log_text, formatter)
+        if section_type is _BLANK_LINE:
             current_blank_lines.append(formatter)
         else:
             formatters += current_blank_lines
             current_blank_lines = []
             formatters.append(formatter)
 
-        offset += len(section_content)
-    return "\n".join(f.reformatted(width) for f in formatters) + "\n"
+        offset += content_length
 
+    # Joining with a trailing empty string adds our final newline without copying the
+    # whole document a second time. Empty documents are still a single newline.
+    reformatted_sections = [f.reformatted(width) for f in formatters] or [""]
+    reformatted_sections.append("")
+    return "\n".join(reformatted_sections)
 
-def reformat_markdown_text(text: str, width: Number = 88) -> str:
+
+def reformat_markdown_text(text: str, width: Number = 88, strict: bool = False) -> str:
     """Reformat a block of markdown text
 
     See the README for how the Markdown text gets reformatted.
@@ -141,17 +163,31 @@ def reformat_markdown_text(text: str, width: Number = 88) -> str:
         text: The Markdown text to rerender
         width: The maximum line length. Note, for table a code blocks, this length is
             not enforced as the would change the documents appearance when rendered.
+        strict: Reformat the reformatted text and ensure it is unchanged. This doubles
+            the work done and is intended for catching bugs in MarkFlow.
 
     Returns:
         The reformatted Markdown text
+
+    Raises:
+        ReformatInconsistentException: If strict is set and reformatting the output
+            changes it.
     """
-    new_text = _reformat_markdown_text(text, width)
-    level = logger.getEffectiveLevel()
-    # Mute logging during second pass since it means nothing to the user.
-    if level > logging.DEBUG:
-        logger.setLevel(logging.ERROR)
-    new_new_text = _reformat_markdown_text(new_text, width)
-    logger.setLevel(level)
+    if not strict:
+        return _reformat_markdown_text(text, width)
+
+    # Most lines come out of a reformat unchanged, so the consistency pass can reuse
+    # the first pass' classifications.
+    classify_cache: Dict[str, MarkdownSectionEnum] = {}
+    new_text = _reformat_markdown_text(text, width, classify_cache=classify_cache)
+
+    # Mute logging during second pass since it means nothing to the user, unless they
+    # are debugging. We hand it the reformatted text rather than reusing the first
+    # pass' output sections so that it sees what is actually written out.
+    quiet = not logger.isEnabledFor(logging.DEBUG)
+    new_new_text = _reformat_markdown_text(
+        new_text, width, quiet=quiet, classify_cache=classify_cache
+    )
     if new_new_text != new_text:
         raise ReformatInconsistentException(
             "Reformat of reformatted code results in different text. Please open a bug "
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Callable, List, Tuple, Union
 
 try:
@@ -11,7 +12,19 @@ SectionEndedFunc = Callable[[str, int, List[str]], bool]
 
 
 class SplitFunc(Protocol):
-    def __call__(
-        self, lines: List[str], line_offset: int = 0
-    ) -> Tuple[List[str], List[str]]:
+    def __call__(self, lines: List[str], start: int = 0) -> Tuple[List[str], int]:
         pass
+
+
+class MarkdownSectionEnum(Enum):
+    ATX_HEADING = "ATX Heading"
+    BLANK_LINE = "Blank Line"
+    BLOCK_QUOTE = "Block Quote"
+    FENCED_CODE_BLOCK = "Fenced Code Block"
+    INDENTED_CODE_BLOCK = "Indented Code Block"
+    LINK_REFERENCE_DEFINITION = "Link Reference Definition"
+    LIST = "List"
+    PARAGRAPH = "Paragraph"
+    SETEXT_HEADING = "Setext Heading"
+    TABLE = "Table"
+    THEMATIC_BREAK = "Thematic Break"
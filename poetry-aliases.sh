@@ -7,4 +7,4 @@ alias pytest="poetry run pytest"
 alias python="poetry run python"
 
 # Alias for running MarkFlow on our files that avoids clobbering out tests.
-alias markflow-markflow='git ls-files | egrep ".md\$\$" | grep -v "tests/" | xargs poetry run markflow --check'
+alias markflow-markflow='git ls-files | egrep ".md\$\$" | grep -v "tests/" | xargs poetry run markflow --check --strict'
@@ -1,6 +1,16 @@
-from typing import Any, Callable, Iterable, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 ExceptionClass = type
+_F = TypeVar("_F", bound=Callable[..., Any])
 
 class MarkGenerator:
     def __getattr__(self, name: str) -> Any: ...
@@ -21,6 +31,10 @@ class MarkGenerator:
         strict: bool = ...,
     ) -> Callable[..., Any]: ...
 
+def fixture(function: _F) -> _F: ...
+def raises(
+    expected_exception: ExceptionClass, *, match: Optional[str] = ...
+) -> ContextManager[Any]: ...
 def xfail(reason: str = ...) -> None: ...
 
 mark: MarkGenerator
@@ -47,3 +47,11 @@ class TestCodeBlock:
         code_block = create_section(MarkdownFencedCodeBlock, expected)
         assert code_block.reformatted() == expected
         assert render(expected) == render(input_)
+
+    def test_unclosed_at_end_of_document(self) -> None:
+        input_ = "```python"
+        expected = "```python\n```"
+        code_block = create_section(MarkdownFencedCodeBlock, input_)
+        assert "first_line=None" in repr(code_block)
+        assert code_block.reformatted() == expected
+        assert render(expected) == render(input_)
@@ -88,7 +88,7 @@ class TestFiles:
 
         input_text = file_pair.input.read_text()
         output_text = file_pair.output.read_text()
-        reformatted = reformat_markdown_text(input_text)
+        reformatted = reformat_markdown_text(input_text, strict=True)
         assert reformatted == output_text
         rereformatted = reformat_markdown_text(reformatted)
         assert rereformatted == output_text
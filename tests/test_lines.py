@@ -0,0 +1,45 @@
+import pytest
+
+from markflow.detectors._lines import classify_line, is_paragraph_start_line
+from markflow.typing import MarkdownSectionEnum
+
+
+class TestClassifyLine:
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            ("", MarkdownSectionEnum.BLANK_LINE),
+            ("   ", MarkdownSectionEnum.BLANK_LINE),
+            ("# Heading", MarkdownSectionEnum.ATX_HEADING),
+            ("#Heading", MarkdownSectionEnum.ATX_HEADING),
+            ("> Quote", MarkdownSectionEnum.BLOCK_QUOTE),
+            ("```python", MarkdownSectionEnum.FENCED_CODE_BLOCK),
+            ("    ~~~", MarkdownSectionEnum.FENCED_CODE_BLOCK),
+            ("    # Code", MarkdownSectionEnum.INDENTED_CODE_BLOCK),
+            ("[label]: link", MarkdownSectionEnum.LINK_REFERENCE_DEFINITION),
+            ("* Item", MarkdownSectionEnum.LIST),
+            ("12. Item", MarkdownSectionEnum.LIST),
+            ("* * *", MarkdownSectionEnum.LIST),
+            ("---", MarkdownSectionEnum.THEMATIC_BREAK),
+            ("_ _ _", MarkdownSectionEnum.THEMATIC_BREAK),
+            ("|Table|", MarkdownSectionEnum.TABLE),
+            ("Text", MarkdownSectionEnum.PARAGRAPH),
+            ("``Text", MarkdownSectionEnum.PARAGRAPH),
+            ("1.Text", MarkdownSectionEnum.PARAGRAPH),
+            ("1) Text", MarkdownSectionEnum.PARAGRAPH),
+            ("===", MarkdownSectionEnum.PARAGRAPH),
+        ],
+    )
+    def test_classify_line(self, line: str, expected: MarkdownSectionEnum) -> None:
+        assert classify_line(line) == expected
+
+
+class TestIsParagraphStartLine:
+    def test_paragraph(self) -> None:
+        assert is_paragraph_start_line("Text")
+
+    def test_link_reference_definition(self) -> None:
+        assert is_paragraph_start_line("[label] is not a definition")
+
+    def test_list(self) -> None:
+        assert not is_paragraph_start_line("- Item")
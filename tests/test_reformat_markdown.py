@@ -0,0 +1,73 @@
+import pathlib
+from typing import Any, List
+
+import pytest
+
+import markflow.__main__
+import markflow.reformat_markdown
+from markflow.exceptions import ReformatInconsistentException
+from markflow.reformat_markdown import reformat_markdown_text
+
+
+class TestStrict:
+    @pytest.fixture
+    def passes(self, monkeypatch: Any) -> List[str]:
+        """Make every reformat pass change its input, recording each pass' input"""
+        passes: List[str] = []
+
+        def inconsistent_reformat(text: str, *args: Any, **kwargs: Any) -> str:
+            passes.append(text)
+            return text + "Changed\n"
+
+        monkeypatch.setattr(
+            markflow.reformat_markdown, "_reformat_markdown_text", inconsistent_reformat
+        )
+        return passes
+
+    def test_default_skips_consistency_pass(self, passes: List[str]) -> None:
+        assert reformat_markdown_text("Text\n") == "Text\nChanged\n"
+        assert passes == ["Text\n"]
+
+    def test_strict_raises_on_inconsistency(self, passes: List[str]) -> None:
+        with pytest.raises(ReformatInconsistentException):
+            reformat_markdown_text("Text\n", strict=True)
+        assert passes == ["Text\n", "Text\nChanged\n"]
+
+    def test_strict_consistent(self) -> None:
+        assert reformat_markdown_text("Text\n", strict=True) == "Text\n"
+
+
+class TestCommandLineStrict:
+    @pytest.fixture
+    def strict_args(self, monkeypatch: Any) -> List[bool]:
+        """Record whether the CLI reformats each file in strict mode"""
+        strict_args: List[bool] = []
+
+        def recording_reformat(text: str, width: Any, strict: bool = False) -> str:
+            strict_args.append(strict)
+            return text
+
+        monkeypatch.setattr(
+            markflow.__main__, "reformat_markdown_text", recording_reformat
+        )
+        return strict_args
+
+    @pytest.fixture
+    def markdown_file(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        path = tmp_path / "file.md"
+        path.write_text("Text\n")
+        return path
+
+    @pytest.mark.parametrize(
+        "flags,expected",
+        [([], False), (["--strict"], True), (["--write-renders"], True)],
+    )
+    def test_flags(
+        self,
+        strict_args: List[bool],
+        markdown_file: pathlib.Path,
+        flags: List[str],
+        expected: bool,
+    ) -> None:
+        assert markflow.__main__.main(["--check", *flags, str(markdown_file)]) == 0
+        assert strict_args == [expected]